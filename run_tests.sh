@@ -1,10 +1,12 @@
 #!/bin/bash
-# Script to run all tests in the tests directory regardless of naming convention
+# Script to run all tests in the tests directory
 
 echo "Running all tests in the tests directory..."
 
-# Run the tests with unittest discover
-python -m unittest discover -s tests -p "*.py"
+# Run the tests with unittest discover, importing the package from the
+# project root next to this script
+PYTHONPATH="$(cd "$(dirname "$0")" && pwd)${PYTHONPATH:+:$PYTHONPATH}" \
+    python -m unittest discover -s tests
 
 # Capture the exit code
 EXIT_CODE=$?
@@ -7,21 +7,53 @@ for output folder, image format, page selection, and recursive directory scannin
 """
 
 import argparse
+import logging
+import logging.handlers
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
+from itertools import count, repeat
 import fitz  # PyMuPDF package
 import numpy as np
 import cv2
-import tempfile
-from PIL import Image
 
+# File extensions OpenCV chooses the encoder from for each output format
+IMAGE_EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "bmp": ".bmp"}
 
-def parse_args():
+# Number of threads writing images to disk while extraction carries on
+IO_WORKERS = 4
+
+# Kernels shared by every region detection: a 5-tap Gaussian applied along
+# each axis to reduce noise, and the structuring element closing edge gaps
+BLUR_KERNEL = cv2.getGaussianKernel(5, 0)
+CLOSE_KERNEL = np.ones((7, 7), np.uint8)
+
+# Smallest number of pages worth starting worker processes for; fewer are
+# done before the workers would have reopened the PDF
+MIN_PARALLEL_PAGES = 4
+
+# Number of leading bytes the PDF header must appear in
+PDF_HEADER_SEARCH_SIZE = 1024
+
+# A single page number or a page range, each part of a pages string
+PAGES_PART_PATTERN = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+
+# Number of log messages buffered before they are written out
+LOG_BUFFER_SIZE = 256
+
+logger = logging.getLogger("card_extractor")
+
+
+@lru_cache(maxsize=None)
+def _build_parser():
     """
-    Parse command-line arguments for the PDF Image Extractor tool.
+    Build the command-line argument parser once and reuse it for every call.
     
     Returns:
-        argparse.Namespace: The parsed arguments
+        argparse.ArgumentParser: The argument parser
     """
     parser = argparse.ArgumentParser(
         description="Extract images from PDF files",
@@ -62,8 +94,118 @@ def parse_args():
         help="Recursively scan subfolders for PDF files"
     )
     
-    # Parse and return the arguments
-    return parser.parse_args()
+    # Optional quiet flag
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Only report warnings and errors"
+    )
+    
+    # Optional number of worker processes
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Number of processes used to extract PDFs and pages in parallel (default: one per CPU)"
+    )
+    
+    return parser
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line arguments for the PDF Image Extractor tool.
+    
+    Args:
+        argv (list): Arguments to parse (None uses sys.argv)
+        
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    return _build_parser().parse_args(argv)
+
+
+def configure_logging(level=logging.INFO):
+    """
+    Send log messages to stdout, buffering them so progress messages don't
+    flush the terminal one line at a time.
+    
+    Args:
+        level (int): Lowest level of the messages to show
+    """
+    # Replace any handlers inherited from a parent process
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(logging.handlers.MemoryHandler(
+        LOG_BUFFER_SIZE, flushLevel=logging.ERROR, target=stream_handler))
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+def _flush_log():
+    """
+    Write out buffered log messages, e.g. before prompting the user or
+    starting worker processes that would inherit the buffer.
+    """
+    for handler in logger.handlers:
+        handler.flush()
+
+
+def _configure_worker_logging(level):
+    """
+    Set up logging in a worker process the same way as in its parent.
+    
+    Args:
+        level (int): Log level of the parent, or None if it has no handlers
+    """
+    if level is not None:
+        configure_logging(level)
+
+
+def _create_worker_pool(workers):
+    """
+    Create a process pool whose workers log the same way as this process.
+    
+    Args:
+        workers (int): Number of worker processes
+        
+    Returns:
+        concurrent.futures.ProcessPoolExecutor: The process pool
+    """
+    _flush_log()
+    level = logger.level if logger.handlers else None
+    return ProcessPoolExecutor(max_workers=workers, initializer=_configure_worker_logging,
+                               initargs=(level,))
+
+
+@lru_cache(maxsize=256)
+def _parse_page_spec(pages_string):
+    """
+    Split a pages string into its parts once, independently of any PDF.
+    
+    Args:
+        pages_string (str): String specifying pages (e.g., '1', '1-3', '1,5,8')
+        
+    Returns:
+        tuple: One (part, is_range, start, end) tuple per comma-separated part,
+        with 1-based bounds that are None if the part is not a valid number
+    """
+    spec = []
+    
+    # Split by comma to handle comma-separated values
+    for part in pages_string.split(','):
+        match = PAGES_PART_PATTERN.fullmatch(part)
+        if match is None:
+            start = end = None
+        else:
+            # Single page numbers are ranges of one page (e.g., 3 is 3-3)
+            start = int(match.group(1))
+            end = int(match.group(2) or start)
+        spec.append((part, '-' in part, start, end))
+    
+    return tuple(spec)
 
 
 def parse_pages(pages_string, total_pages):
@@ -83,104 +225,237 @@ def parse_pages(pages_string, total_pages):
     
     pages_to_process = set()
     
-    # Split by comma to handle comma-separated values
-    for part in pages_string.split(','):
-        # Handle page ranges (e.g., 1-3)
-        if '-' in part:
-            try:
-                start, end = map(int, part.split('-'))
-                # Convert to 0-based indexing and ensure within bounds
-                start = max(1, start) - 1
-                end = min(total_pages, end) - 1
-                # Add all pages in the range
-                pages_to_process.update(range(start, end + 1))
-            except ValueError:
-                print(f"Warning: Invalid page range '{part}', skipping")
+    # The string is the same for every PDF in a run, so only its parsed
+    # parts are cached and the page bounds are applied per PDF
+    for part, is_range, start, end in _parse_page_spec(pages_string):
+        if start is None:
+            if is_range:
+                logger.warning(f"Warning: Invalid page range '{part}', skipping")
+            else:
+                logger.warning(f"Warning: Invalid page number '{part}', skipping")
+        elif is_range:
+            # Convert to 0-based indexing, keep within bounds and add all
+            # pages in the range
+            pages_to_process.update(range(max(1, start) - 1, min(total_pages, end)))
+        elif 1 <= start <= total_pages:
+            pages_to_process.add(start - 1)
         else:
-            # Handle single page numbers
-            try:
-                page = int(part) - 1  # Convert to 0-based indexing
-                if 0 <= page < total_pages:
-                    pages_to_process.add(page)
-                else:
-                    print(f"Warning: Page {part} out of range, skipping")
-            except ValueError:
-                print(f"Warning: Invalid page number '{part}', skipping")
+            logger.warning(f"Warning: Page {part} out of range, skipping")
     
     return pages_to_process
 
 
-def detect_and_extract_image_regions(image_path, min_area=1000):
+def detect_image_regions(gray, min_area=1000, detection_scale=0.5):
+    """
+    Detect the bounding boxes of distinct image regions on a rendered page using OpenCV.
+    
+    Args:
+        gray (numpy.ndarray): Rendered page as a grayscale numpy array
+        min_area (int): Minimum contour area to consider (filters out noise)
+        detection_scale (float): Scale the page is shrunk to for edge detection;
+            boxes are returned at the resolution of the given page
+        
+    Returns:
+        numpy.ndarray: One (x1, y1, x2, y2) row per region in pixels, largest first
+    """
+    # Get image dimensions
+    height, width = gray.shape[:2]
+    
+    # Only bounding boxes are needed, so find them on a downsampled copy; the
+    # blur below works in place, so the caller's array is never used directly
+    if detection_scale != 1.0:
+        small = cv2.resize(gray, None, fx=detection_scale, fy=detection_scale,
+                           interpolation=cv2.INTER_AREA)
+    else:
+        small = gray.copy()
+    
+    # Apply Gaussian blur in place to reduce noise
+    cv2.sepFilter2D(small, -1, BLUR_KERNEL, BLUR_KERNEL, dst=small)
+    
+    # Find edges by thresholding the Sobel gradient magnitude; only region
+    # outlines are needed, so Canny's thinning and hysteresis are skipped
+    grad_x = cv2.convertScaleAbs(cv2.Sobel(small, cv2.CV_16S, 1, 0, ksize=3))
+    grad_y = cv2.convertScaleAbs(cv2.Sobel(small, cv2.CV_16S, 0, 1, ksize=3))
+    magnitude = cv2.addWeighted(grad_x, 0.5, grad_y, 0.5, 0)
+    _, edges = cv2.threshold(magnitude, 50, 255, cv2.THRESH_BINARY)
+    
+    # Close gaps in the edges with a single morphological pass
+    closed = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, CLOSE_KERNEL)
+    
+    # Label connected edge regions in a single pass; each stats row is
+    # (x, y, w, h, area) and row 0 is the background
+    _, _, stats, _ = cv2.connectedComponentsWithStats(closed, connectivity=8)
+    
+    # Scale the boxes back up to the resolution of the given page
+    scale = np.array([width / small.shape[1], height / small.shape[0]] * 2)
+    x, y, w, h = np.round(stats[1:, :4] * scale).astype(np.int64).T
+    box_areas = w * h
+    
+    # Add a small margin around each region (5% of width/height), making
+    # sure margins don't extend beyond image boundaries
+    margin_x = (w * 0.05).astype(np.int64)
+    margin_y = (h * 0.05).astype(np.int64)
+    x1 = np.maximum(0, x - margin_x)
+    y1 = np.maximum(0, y - margin_y)
+    x2 = np.minimum(width, x + w + margin_x)
+    y2 = np.minimum(height, y + h + margin_y)
+    
+    # Skip noise, very small regions and those that are nearly the full page
+    region_areas = (x2 - x1) * (y2 - y1)
+    page_area = width * height
+    keep = ((box_areas > min_area) & (region_areas >= min_area)
+            & (region_areas <= page_area * 0.9))
+    
+    # Sort the remaining regions by area, largest first
+    order = np.flatnonzero(keep)[np.argsort(-box_areas[keep], kind="stable")]
+    boxes = np.stack([x[order], y[order], x[order] + w[order], y[order] + h[order]], axis=1)
+    
+    # Drop regions nested inside a larger one (e.g. artwork inside a card
+    # frame) so only the outermost region is kept
+    contained = ((boxes[:, None, 0] >= boxes[None, :, 0]) & (boxes[:, None, 1] >= boxes[None, :, 1])
+                 & (boxes[:, None, 2] <= boxes[None, :, 2]) & (boxes[:, None, 3] <= boxes[None, :, 3]))
+    order = order[~np.tril(contained, k=-1).any(axis=1)]
+    
+    return np.stack([x1[order], y1[order], x2[order], y2[order]], axis=1)
+
+
+def detect_and_extract_image_regions(image, min_area=1000, detection_scale=0.5):
     """
     Detect and extract distinct image regions from a rendered page using OpenCV.
     
     Args:
-        image_path (str): Path to the rendered page image
+        image (numpy.ndarray or str): Rendered page as a numpy array (BGR format),
+            or the path of an image file to read it from
         min_area (int): Minimum contour area to consider (filters out noise)
+        detection_scale (float): Scale the page is shrunk to for edge detection;
+            regions are still cropped from the full resolution image
         
     Returns:
         list: List of extracted images as numpy arrays
-    """
-    # Read the image
-    image = cv2.imread(image_path)
-    if image is None:
-        print(f"Error: Could not read image at {image_path}")
-        return []
     
-    # Get image dimensions
-    height, width = image.shape[:2]
+    Raises:
+        ValueError: If image is a path that cannot be read as an image
+    """
+    # Pages rendered in memory are used as they are, only paths are read
+    if isinstance(image, (str, os.PathLike)):
+        path = image
+        image = cv2.imread(os.fspath(path), cv2.IMREAD_COLOR)
+        if image is None:
+            raise ValueError(f"Could not read image: {path}")
     
     # Convert to grayscale for processing
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    boxes = detect_image_regions(gray, min_area, detection_scale)
     
-    # Apply Gaussian blur to reduce noise
-    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-    
-    # Use Canny edge detection
-    edges = cv2.Canny(blurred, 50, 150)
+    # Crop the regions from the original image
+    return [image[y1:y2, x1:x2] for x1, y1, x2, y2 in boxes]
+
+
+def crop_image_regions(image, rects, scale=1.0):
+    """
+    Crop known image placements out of a rendered page.
     
-    # Dilate to close gaps in edges
-    kernel = np.ones((5, 5), np.uint8)
-    dilated = cv2.dilate(edges, kernel, iterations=2)
+    Args:
+        image (numpy.ndarray): Rendered page as a numpy array
+        rects (list): Bounding boxes (x0, y0, x1, y1) in page coordinates
+        scale (float): Zoom factor the page was rendered with
     
-    # Find contours
-    contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    Returns:
+        list: List of cropped images as numpy arrays
+    """
+    height, width = image.shape[:2]
     
-    # Filter contours by area to exclude small noise
-    significant_contours = [cnt for cnt in contours if cv2.contourArea(cnt) > min_area]
+    # Scale all boxes to pixel coordinates and clip them to the image
+    boxes = np.asarray(rects, dtype=np.float64).reshape(-1, 4) * scale
+    x1, x2 = np.clip(np.round(boxes[:, [0, 2]]), 0, width).astype(np.int64).T
+    y1, y2 = np.clip(np.round(boxes[:, [1, 3]]), 0, height).astype(np.int64).T
     
-    # Sort contours by area, largest first
-    significant_contours.sort(key=cv2.contourArea, reverse=True)
+    # Skip placements that are empty or entirely off the page
+    return [image[y1[i]:y2[i], x1[i]:x2[i]] for i in np.flatnonzero((x2 > x1) & (y2 > y1))]
+
+
+def open_unique_file(stem_path, ext):
+    """
+    Create a new file for writing, adding a numerical suffix if the name is taken.
     
-    # Extract the image regions
-    extracted_images = []
+    The file is created atomically, so concurrent workers never claim the same name.
     
-    for i, contour in enumerate(significant_contours):
-        # Get bounding rectangle for the contour
-        x, y, w, h = cv2.boundingRect(contour)
-        
-        # Add a small margin around the region (5% of width/height)
-        margin_x = int(w * 0.05)
-        margin_y = int(h * 0.05)
-        
-        # Ensure margins don't extend beyond image boundaries
-        x1 = max(0, x - margin_x)
-        y1 = max(0, y - margin_y)
-        x2 = min(width, x + w + margin_x)
-        y2 = min(height, y + h + margin_y)
-        
-        # Crop the region from the original image
-        region = image[y1:y2, x1:x2]
+    Args:
+        stem_path (str): Preferred path of the file, without the extension
+        ext (str): File extension, including the leading dot
         
-        # Skip very small regions or those that are nearly the full page
-        region_area = (x2 - x1) * (y2 - y1)
-        page_area = width * height
-        if region_area < min_area or region_area > page_area * 0.9:
+    Returns:
+        tuple: (file descriptor opened for writing, path of the created file)
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    
+    for counter in count():
+        # Add a numerical suffix before the extension once the name is taken
+        output_path = f"{stem_path}{ext}" if counter == 0 else f"{stem_path}_{counter}{ext}"
+        try:
+            fd = os.open(output_path, flags, 0o644)
+        except FileExistsError:
             continue
+        return fd, output_path
+
+
+def _write_fd(fd, data):
+    """
+    Write all of the data to a file descriptor and close it.
+    
+    Args:
+        fd (int): File descriptor opened for writing
+        data (bytes): Data to write
+    """
+    try:
+        # os.write may write less than requested, so keep going until done
+        remaining = memoryview(data)
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
+
+def _wait_for_writes(pending_writes):
+    """
+    Wait for queued image writes, removing the files of those that failed.
+    
+    Args:
+        pending_writes (list): (future, path of the claimed file, message to
+            log if the write failed) for each queued write
+        
+    Returns:
+        int: Number of images written successfully
+    """
+    written = 0
+    for future, output_path, error_message in pending_writes:
+        try:
+            future.result()
+            written += 1
+        except Exception as e:
+            logger.error(f"  {error_message}: {str(e)}")
+            # Do not leave an empty or truncated image behind
+            with suppress(OSError):
+                os.remove(output_path)
+    return written
+
+
+def _pixmap_to_array(pix):
+    """
+    View the samples of a rendered pixmap as a numpy array without copying.
+    
+    The view does not keep the pixmap alive, so it must outlive the array.
+    
+    Args:
+        pix (fitz.Pixmap): Pixmap rendered without alpha
         
-        extracted_images.append(region)
+    Returns:
+        numpy.ndarray: Grayscale array, or BGR array for color pixmaps
+    """
+    samples = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
     
-    return extracted_images
+    # MuPDF renders RGB, while OpenCV works in BGR
+    return samples[..., 0] if pix.n == 1 else samples[..., ::-1]
 
 
 def save_image(image_array, output_path, format="png"):
@@ -189,20 +464,240 @@ def save_image(image_array, output_path, format="png"):
     
     Args:
         image_array (numpy.ndarray): Image as a numpy array (BGR format from OpenCV)
-        output_path (str): Path where to save the image
+        output_path (str or file object): Path or binary file to save the image to
         format (str): Image format (png, jpeg, bmp)
     """
-    # Convert BGR to RGB (OpenCV uses BGR, PIL uses RGB)
-    image_rgb = cv2.cvtColor(image_array, cv2.COLOR_BGR2RGB)
+    extension = IMAGE_EXTENSIONS.get(format.lower())
+    if extension is None:
+        raise ValueError(f"Unsupported image format: {format}")
+    
+    # Encode straight from BGR, which is OpenCV's native channel order
+    success, encoded = cv2.imencode(extension, image_array)
+    if not success:
+        raise ValueError(f"Could not encode image as {format}")
     
-    # Convert numpy array to PIL Image
-    pil_image = Image.fromarray(image_rgb)
+    # Write the encoded bytes to the open file or to a new file at the path
+    if hasattr(output_path, "write"):
+        output_path.write(encoded)
+    else:
+        with open(output_path, "wb") as image_file:
+            image_file.write(encoded)
+
+
+def _save_image_fd(image_array, fd, format):
+    """
+    Save a numpy image array to a file descriptor and close it.
+    
+    Args:
+        image_array (numpy.ndarray): Image as a numpy array (BGR format from OpenCV)
+        fd (int): File descriptor opened for writing
+        format (str): Image format (png, jpeg, bmp)
+    """
+    with open(fd, "wb") as image_file:
+        save_image(image_array, image_file, format=format)
+
+
+def _looks_like_pdf(pdf_path):
+    """
+    Check for the PDF header without parsing the file.
     
-    # Save the image
-    pil_image.save(output_path, format=format.upper())
+    Args:
+        pdf_path (str): Path to the file
+        
+    Returns:
+        bool: True if the file starts with a PDF header
+    """
+    # Readers accept a few bytes of junk before the header, so search for it
+    # instead of only checking the start of the file
+    with open(pdf_path, "rb") as pdf_file:
+        return b"%PDF-" in pdf_file.read(PDF_HEADER_SEARCH_SIZE)
 
 
-def process_pdf(pdf_path, output_folder, output_format="png", pages_string=None):
+def process_page(doc, page_idx, page_count, source_doc_name, output_folder, io_pool, output_format="png"):
+    """
+    Extract the images from a single page of an open PDF document.
+    
+    Args:
+        doc (fitz.Document): The open PDF document
+        page_idx (int): Index of the page to process (0-based)
+        page_count (int): Number of pages in the document
+        source_doc_name (str): Name of the source PDF used to name the images
+        output_folder (str): Path to the output folder where images will be saved
+        io_pool (concurrent.futures.Executor): Executor the image files are written on
+        output_format (str): Format to save images in (png, jpeg, bmp)
+    """
+    page = doc[page_idx]
+    page_num = page_idx + 1
+    logger.info(f"Processing page {page_num} of {page_count}")
+    
+    # First attempt - try using the standard extract_image approach
+    image_list = page.get_images(full=True)
+    
+    # Output paths only differ in the image number, so build the rest once
+    # following the required naming convention
+    path_prefix = os.path.join(output_folder, f"{source_doc_name}-page-{page_num}-image-")
+    
+    # Track image count for this page
+    img_count = 0
+    
+    # Writes queued on the I/O pool, with the file they claimed and the
+    # message to print if one fails
+    pending_writes = []
+    
+    # Process all images if there are any detected
+    if image_list:
+        # Keep track of the images already extracted from this page
+        seen_xrefs = set()
+        
+        for img in image_list:
+            xref = img[0]
+            
+            # Skip images referenced more than once, their data is identical
+            if xref in seen_xrefs:
+                continue
+            
+            seen_xrefs.add(xref)
+            img_count += 1
+            
+            try:
+                # Extract the image
+                image_data = doc.extract_image(xref)
+                ext = image_data["ext"]
+                
+                # Claim a new file, adding a suffix if the name is taken, and
+                # write the image data to it in the background
+                fd, output_path = open_unique_file(f"{path_prefix}{img_count}", f".{ext}")
+                pending_writes.append((io_pool.submit(_write_fd, fd, image_data["image"]),
+                                       output_path, f"Error writing image {img_count} (xref={xref})"))
+                
+                # Print the image information
+                logger.info(f"  Extracted image: {os.path.basename(output_path)}, "
+                            f"Dimensions: {image_data['width']}x{image_data['height']}")
+                    
+            except Exception as e:
+                logger.error(f"  Error extracting image {img_count} (xref={xref}): {str(e)}")
+    
+    # Only images that were actually written count as extracted, so a page
+    # whose writes all failed still falls back to rendering
+    extracted_any_images = _wait_for_writes(pending_writes) > 0
+    pending_writes = []
+    
+    # If no images were successfully extracted using traditional methods,
+    # fall back to rendering the page and using computer vision
+    if not extracted_any_images:
+        logger.info(f"  No images extracted using standard method from page {page_num}")
+        
+        # Image placements known to MuPDF (e.g. inline images) can be
+        # cropped directly, so computer vision is only needed without them;
+        # their boxes are in unrotated page space, so apply the page rotation
+        # the page is rendered with
+        image_rects = [fitz.Rect(info["bbox"]) * page.rotation_matrix for info in page.get_image_info()]
+        if image_rects:
+            logger.info(f"  Cropping {len(image_rects)} image placements found on page {page_num}")
+        else:
+            logger.info(f"  Using computer vision to detect images on page {page_num}")
+        
+        # Render the page at a high zoom factor for good quality crops
+        zoom_factor = 2.0  # Higher zoom = better quality
+        mat = fitz.Matrix(zoom_factor, zoom_factor)
+        
+        # Pixmaps viewed by the extracted regions; the views do not keep them
+        # alive, so they are held until the page is done
+        pixmaps = []
+        
+        if image_rects:
+            pixmaps.append(page.get_pixmap(matrix=mat, alpha=False))
+            extracted_regions = crop_image_regions(_pixmap_to_array(pixmaps[0]), image_rects, zoom_factor)
+        else:
+            # Use computer vision on a grayscale render, a third of the size
+            # of a color one, to detect the image regions
+            gray_pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+            boxes = detect_image_regions(_pixmap_to_array(gray_pix))
+            gray_pix = None
+            
+            # Render only the detected regions in color
+            for box in boxes:
+                clip = fitz.Rect(*box.tolist()) * ~mat
+                pixmaps.append(page.get_pixmap(matrix=mat, clip=clip, alpha=False))
+            extracted_regions = [_pixmap_to_array(region_pix) for region_pix in pixmaps]
+        
+        if not extracted_regions:
+            logger.info(f"  No distinct image regions detected on page {page_num}")
+            # Save the whole page as a single image, rendering it in color
+            # unless that was already done
+            if not pixmaps:
+                pixmaps.append(page.get_pixmap(matrix=mat, alpha=False))
+            page_image = _pixmap_to_array(pixmaps[0])
+            region_count = 1
+            
+            # Save the rendered page in the requested format without overwriting
+            fd, page_image_path = open_unique_file(f"{path_prefix}{region_count}", f".{output_format}")
+            pending_writes.append((io_pool.submit(_save_image_fd, page_image, fd, output_format),
+                                   page_image_path, f"Error saving page {page_num}"))
+            
+            height, width = page_image.shape[:2]
+            logger.info(f"  Saved full page as: {os.path.basename(page_image_path)}, "
+                        f"Dimensions: {width}x{height}")
+        else:
+            logger.info(f"  Detected {len(extracted_regions)} distinct image regions on page {page_num}")
+            
+            # Save each detected region as a separate image
+            for i, region in enumerate(extracted_regions):
+                region_count = i + 1
+                
+                # Save the cropped region without overwriting
+                fd, region_image_path = open_unique_file(f"{path_prefix}{region_count}",
+                                                         f".{output_format}")
+                pending_writes.append((io_pool.submit(_save_image_fd, region, fd, output_format),
+                                       region_image_path, f"Error saving region {region_count}"))
+                
+                height, width = region.shape[:2]
+                logger.info(f"  Extracted region: {os.path.basename(region_image_path)}, "
+                            f"Dimensions: {width}x{height}")
+    
+    # Wait for this page's writes, which also keeps the rendered pixmaps
+    # alive until every region viewing them is saved
+    _wait_for_writes(pending_writes)
+    
+    # Drop the views into the samples before the pixmaps that own them
+    extracted_regions = page_image = region = None
+    pixmaps = None
+
+
+def _process_pages_in_worker(pdf_path, page_indices, output_folder, output_format, password):
+    """
+    Process a share of the pages of a PDF inside a worker process.
+    
+    PyMuPDF documents cannot be shared between processes, so each worker
+    opens its own handle on the PDF.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        page_indices (list): Indices of the pages to process (0-based)
+        output_folder (str): Path to the output folder where images will be saved
+        output_format (str): Format to save images in (png, jpeg, bmp)
+        password (str): Password for the PDF, or None if it is not protected
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        if password:
+            doc.authenticate(password)
+        source_doc_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        page_count = len(doc)
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as io_pool:
+            for page_idx in page_indices:
+                process_page(doc, page_idx, page_count, source_doc_name, output_folder, io_pool,
+                             output_format)
+    finally:
+        doc.close()
+        _flush_log()
+        
+        # Empty MuPDF's resource cache, which is not released with the document
+        fitz.TOOLS.store_shrink(100)
+
+
+def process_pdf(pdf_path, output_folder, output_format="png", pages_string=None, workers=1,
+                interactive=True):
     """
     Process a PDF file to extract images.
     
@@ -211,187 +706,98 @@ def process_pdf(pdf_path, output_folder, output_format="png", pages_string=None)
         output_folder (str): Path to the output folder where images will be saved
         output_format (str): Format to save images in (png, jpeg, bmp)
         pages_string (str): String specifying which pages to process
+        workers (int): Number of processes to spread the pages over
+            (None uses one per CPU)
+        interactive (bool): Whether to prompt for the password of protected PDFs
+        
+    Returns:
+        bool: True if the PDF was skipped because it needs a password and
+        interactive is False, otherwise False
     """
     try:
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_folder):
-            os.makedirs(output_folder)
-            
-        # Try to open the PDF document
-        try:
-            doc = fitz.open(pdf_path)
-        except RuntimeError as e:
-            # Check if this is a password-protected PDF
-            if "password" in str(e).lower():
-                password = input(f"PDF '{pdf_path}' is password-protected. Enter password: ")
-                if not password:
-                    print(f"No password provided, skipping '{pdf_path}'")
-                    return
-                try:
-                    doc = fitz.open(pdf_path, password=password)
-                except Exception:
-                    print(f"Incorrect password, skipping '{pdf_path}'")
-                    return
-            else:
-                raise
+        os.makedirs(output_folder, exist_ok=True)
+        
+        # Skip files that are not PDFs before MuPDF starts parsing them
+        if not _looks_like_pdf(pdf_path):
+            logger.error(f"Error: '{pdf_path}' is corrupted or not a valid PDF file")
+            return False
+        
+        # Open the PDF document
+        doc = fitz.open(pdf_path)
+        
+        # Unlock password-protected PDFs on the already open document
+        password = None
+        if doc.needs_pass:
+            if not interactive:
+                doc.close()
+                return True
+            _flush_log()
+            password = input(f"PDF '{pdf_path}' is password-protected. Enter password: ")
+            if not password:
+                logger.warning(f"No password provided, skipping '{pdf_path}'")
+                doc.close()
+                return False
+            if not doc.authenticate(password):
+                logger.warning(f"Incorrect password, skipping '{pdf_path}'")
+                doc.close()
+                return False
         
-        print(f"Processing: {pdf_path}")
+        logger.info(f"Processing: {pdf_path}")
         
         # Get the source document name (without extension)
         source_doc_name = os.path.splitext(os.path.basename(pdf_path))[0]
         
         # Determine which pages to process
-        pages_to_process = parse_pages(pages_string, len(doc))
+        page_count = len(doc)
+        pages_to_process = sorted(parse_pages(pages_string, page_count))
         
-        # Iterate through each page to process
-        for page_idx in pages_to_process:
-            page = doc[page_idx]
-            page_num = page_idx + 1
-            print(f"Processing page {page_num} of {len(doc)}")
-            
-            # First attempt - try using the standard extract_image approach
-            image_list = page.get_images(full=True)
-            
-            # Track image count for this page
-            img_count = 0
-            extracted_any_images = False
-            
-            # Process all images if there are any detected
-            if image_list:
-                # Keep track of unique positions for images
-                position_signatures = set()
-                
-                for img in image_list:
-                    xref = img[0]
-                    
-                    # Create a position signature for this image instance
-                    # Include all available transformation data
-                    position_sig = '-'.join(str(x) for x in img)
-                    
-                    # Skip if we've seen this exact image with this transform before
-                    if position_sig in position_signatures:
-                        continue
-                    
-                    position_signatures.add(position_sig)
-                    img_count += 1
-                    
-                    try:
-                        # Extract the image
-                        image_data = doc.extract_image(xref)
-                        ext = image_data["ext"]
-                        
-                        # Construct output filename using required naming convention
-                        base_filename = f"{source_doc_name}-page-{page_num}-image-{img_count}.{ext}"
-                        output_path = os.path.join(output_folder, base_filename)
-                        
-                        # Check if file exists and add suffix if needed
-                        counter = 1
-                        while os.path.exists(output_path):
-                            # Add a numerical suffix before the extension
-                            filename_parts = os.path.splitext(base_filename)
-                            new_filename = f"{filename_parts[0]}_{counter}{filename_parts[1]}"
-                            output_path = os.path.join(output_folder, new_filename)
-                            counter += 1
-                        
-                        # Write image data to file
-                        with open(output_path, "wb") as img_file:
-                            img_file.write(image_data["image"])
-                        
-                        extracted_any_images = True
-                        
-                        # Print the image information
-                        print(f"  Extracted image: {os.path.basename(output_path)}, "
-                              f"Dimensions: {image_data['width']}x{image_data['height']}")
-                            
-                    except Exception as e:
-                        print(f"  Error extracting image {img_count} (xref={xref}): {str(e)}")
-            
-            # If no images were successfully extracted using traditional methods,
-            # fall back to rendering the page and using computer vision
-            if not extracted_any_images:
-                print(f"  No images extracted using standard method from page {page_num}")
-                print(f"  Using computer vision to detect images on page {page_num}")
-                
-                # Create a temporary file to store the rendered page
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_file:
-                    temp_path = temp_file.name
-                
-                try:
-                    # Render the page to a high-quality pixmap
-                    zoom_factor = 2.0  # Higher zoom = better quality
-                    mat = fitz.Matrix(zoom_factor, zoom_factor)
-                    pix = page.get_pixmap(matrix=mat, alpha=False)
-                    pix.save(temp_path)
-                    
-                    # Use computer vision to detect and extract image regions
-                    extracted_regions = detect_and_extract_image_regions(temp_path)
-                    
-                    if not extracted_regions:
-                        print(f"  No distinct image regions detected on page {page_num}")
-                        # Save the whole page as a single image
-                        region_count = 1
-                        
-                        # Construct output filename for the full page
-                        page_image_name = f"{source_doc_name}-page-{page_num}-image-{region_count}.{output_format}"
-                        page_image_path = os.path.join(output_folder, page_image_name)
-                        
-                        # Handle potential file overwrite
-                        counter = 1
-                        while os.path.exists(page_image_path):
-                            filename_parts = os.path.splitext(page_image_name)
-                            new_filename = f"{filename_parts[0]}_{counter}{filename_parts[1]}"
-                            page_image_path = os.path.join(output_folder, new_filename)
-                            counter += 1
-                        
-                        # Convert from PyMuPDF format to the requested format
-                        # This is simple since we're just copying the file in this case
-                        img = Image.open(temp_path)
-                        img.save(page_image_path, format=output_format.upper())
-                        
-                        print(f"  Saved full page as: {os.path.basename(page_image_path)}, "
-                              f"Dimensions: {pix.width}x{pix.height}")
-                    else:
-                        print(f"  Detected {len(extracted_regions)} distinct image regions on page {page_num}")
-                        
-                        # Save each detected region as a separate image
-                        for i, region in enumerate(extracted_regions):
-                            region_count = i + 1
-                            
-                            # Construct output filename
-                            region_image_name = f"{source_doc_name}-page-{page_num}-image-{region_count}.{output_format}"
-                            region_image_path = os.path.join(output_folder, region_image_name)
-                            
-                            # Handle potential file overwrite
-                            counter = 1
-                            while os.path.exists(region_image_path):
-                                filename_parts = os.path.splitext(region_image_name)
-                                new_filename = f"{filename_parts[0]}_{counter}{filename_parts[1]}"
-                                region_image_path = os.path.join(output_folder, new_filename)
-                                counter += 1
-                            
-                            # Save the cropped region
-                            save_image(region, region_image_path, format=output_format)
-                            
-                            height, width = region.shape[:2]
-                            print(f"  Extracted region: {os.path.basename(region_image_path)}, "
-                                  f"Dimensions: {width}x{height}")
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
+        # Determine how many worker processes to spread the pages over
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if len(pages_to_process) < MIN_PARALLEL_PAGES:
+            workers = 1
+        workers = min(workers, len(pages_to_process))
+        
+        if workers > 1:
+            # Give each worker an interleaved share of the pages so expensive
+            # runs of pages are spread out; workers reopen the PDF themselves,
+            # so release this handle first
+            doc.close()
+            batches = [pages_to_process[i::workers] for i in range(workers)]
+            with _create_worker_pool(workers) as executor:
+                list(executor.map(_process_pages_in_worker, repeat(pdf_path), batches,
+                                  repeat(output_folder), repeat(output_format), repeat(password)))
+            return False
         
-        # Close the document
+        # Iterate through each page to process, writing images on a few
+        # threads while the next ones are extracted
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as io_pool:
+            for page_idx in pages_to_process:
+                process_page(doc, page_idx, page_count, source_doc_name, output_folder, io_pool,
+                             output_format)
+        
+        # Close the document and empty MuPDF's resource cache
         doc.close()
+        fitz.TOOLS.store_shrink(100)
+        return False
         
     except FileNotFoundError:
-        print(f"Error: PDF file not found: {pdf_path}")
+        logger.error(f"Error: PDF file not found: {pdf_path}")
     except fitz.FileDataError:
-        print(f"Error: '{pdf_path}' is corrupted or not a valid PDF file")
+        logger.error(f"Error: '{pdf_path}' is corrupted or not a valid PDF file")
     except Exception as e:
-        print(f"Error processing PDF {pdf_path}: {str(e)}")
+        logger.error(f"Error processing PDF {pdf_path}: {str(e)}")
+    finally:
+        # Write out this PDF's messages, which also makes sure they are not
+        # lost when a worker process exits
+        _flush_log()
+    
+    return False
 
 
-def process_directory(dir_path, output_folder, output_format="png", pages_string=None, recursive=False):
+def process_directory(dir_path, output_folder, output_format="png", pages_string=None, recursive=False,
+                      workers=1):
     """
     Process all PDF files in a directory.
     
@@ -401,19 +807,41 @@ def process_directory(dir_path, output_folder, output_format="png", pages_string
         output_format (str): Format to save images in (png, jpeg, bmp)
         pages_string (str): String specifying which pages to process
         recursive (bool): Whether to recursively scan subdirectories
+        workers (int): Number of processes to spread the PDFs over
+            (None uses one per CPU)
     """
     # Use os.walk for recursive scanning or just os.listdir for non-recursive
     if recursive:
-        for root, _, files in os.walk(dir_path):
-            for file in files:
-                if file.lower().endswith('.pdf'):
-                    pdf_path = os.path.join(root, file)
-                    process_pdf(pdf_path, output_folder, output_format, pages_string)
+        pdf_paths = [os.path.join(root, file)
+                     for root, _, files in os.walk(dir_path)
+                     for file in files if file.lower().endswith('.pdf')]
     else:
-        for file in os.listdir(dir_path):
-            if file.lower().endswith('.pdf'):
-                pdf_path = os.path.join(dir_path, file)
-                process_pdf(pdf_path, output_folder, output_format, pages_string)
+        pdf_paths = [os.path.join(dir_path, file)
+                     for file in os.listdir(dir_path) if file.lower().endswith('.pdf')]
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    # With a single PDF there is nothing to spread, so let process_pdf
+    # spread its pages over the workers instead
+    if workers <= 1 or len(pdf_paths) <= 1:
+        for pdf_path in pdf_paths:
+            process_pdf(pdf_path, output_folder, output_format, pages_string, workers)
+        return
+    
+    # Create the output folder once, before the workers all try to
+    os.makedirs(output_folder, exist_ok=True)
+    
+    # Each worker processes whole PDFs; workers cannot prompt for passwords,
+    # so protected PDFs are handed back and processed here afterwards
+    with _create_worker_pool(min(workers, len(pdf_paths))) as executor:
+        skipped = executor.map(process_pdf, pdf_paths, repeat(output_folder), repeat(output_format),
+                               repeat(pages_string), repeat(1), repeat(False))
+        protected_paths = [pdf_path for pdf_path, needs_password in zip(pdf_paths, skipped)
+                           if needs_password]
+    
+    for pdf_path in protected_paths:
+        process_pdf(pdf_path, output_folder, output_format, pages_string, workers)
 
 
 def main():
@@ -422,25 +850,27 @@ def main():
     """
     # Parse command-line arguments
     args = parse_args()
+    configure_logging(logging.WARNING if args.quiet else logging.INFO)
     
     # Print parsed arguments (for debugging/verification)
-    print(f"Input path: {args.input_path}")
-    print(f"Output folder: {args.output_folder}")
-    print(f"Format: {args.format}")
+    logger.info(f"Input path: {args.input_path}")
+    logger.info(f"Output folder: {args.output_folder}")
+    logger.info(f"Format: {args.format}")
     if args.pages:
-        print(f"Pages: {args.pages}")
+        logger.info(f"Pages: {args.pages}")
     if args.recursive:
-        print("Recursive scanning enabled")
+        logger.info("Recursive scanning enabled")
     
     # Check if input path is a file or directory
     if os.path.isfile(args.input_path):
         # Process a single PDF file
-        process_pdf(args.input_path, args.output_folder, args.format, args.pages)
+        process_pdf(args.input_path, args.output_folder, args.format, args.pages, args.workers)
     elif os.path.isdir(args.input_path):
         # Process a directory of PDF files
-        process_directory(args.input_path, args.output_folder, args.format, args.pages, args.recursive)
+        process_directory(args.input_path, args.output_folder, args.format, args.pages, args.recursive,
+                          args.workers)
     else:
-        print(f"Error: '{args.input_path}' is not a valid file or directory")
+        logger.error(f"Error: '{args.input_path}' is not a valid file or directory")
         sys.exit(1)
 
 
@@ -0,0 +1,1135 @@
+"""
+Unit tests for the PDF Image Extractor main module.
+"""
+
+import unittest
+from contextlib import redirect_stderr
+from unittest.mock import patch, Mock, MagicMock, call
+import io
+import os
+import pathlib
+import tempfile
+import shutil
+import fitz
+import cv2
+import numpy as np
+
+from src.card_extractor.main import (
+    parse_args, process_pdf, process_directory, parse_pages,
+    detect_image_regions, detect_and_extract_image_regions, save_image,
+    _looks_like_pdf
+)
+
+
+class TestArgumentParsing(unittest.TestCase):
+    """Tests for the command-line argument parsing functionality."""
+    
+    @patch('argparse.ArgumentParser.parse_args')
+    def test_argument_parsing(self, mock_parse_args):
+        """Test that argument parsing correctly handles required arguments."""
+        # Mock the return value of parse_args
+        mock_args = MagicMock()
+        mock_args.input_path = 'test.pdf'
+        mock_args.output_folder = 'output'
+        mock_args.format = 'png'
+        mock_args.pages = None
+        mock_args.recursive = False
+        mock_parse_args.return_value = mock_args
+        
+        # Call the function
+        args = parse_args()
+        
+        # Assert the arguments were parsed correctly
+        self.assertEqual(args.input_path, 'test.pdf')
+        self.assertEqual(args.output_folder, 'output')
+        self.assertEqual(args.format, 'png')
+        self.assertIsNone(args.pages)
+        self.assertFalse(args.recursive)
+    
+    @patch('sys.argv', ['main.py', 'test.pdf'])  # Missing required -o argument
+    def test_missing_required_argument(self):
+        """Test that the parser exits when a required argument is missing."""
+        # Capture the usage error argparse prints before exiting
+        stderr = io.StringIO()
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            parse_args()
+        
+        self.assertIn('required: --output-folder/-o', stderr.getvalue())
+    
+    def test_parse_args_argv(self):
+        """Test parsing an explicit argument list with every option."""
+        args = parse_args(['input.pdf', '-o', 'output', '-f', 'jpeg', '-p', '1-3', '-r', '-q', '-w', '2'])
+        
+        # Assert each option was parsed into its attribute
+        self.assertEqual(vars(args), {
+            'input_path': 'input.pdf',
+            'output_folder': 'output',
+            'format': 'jpeg',
+            'pages': '1-3',
+            'recursive': True,
+            'quiet': True,
+            'workers': 2,
+        })
+        
+        # Check that the defaults apply to a second parse with the same parser
+        args = parse_args(['input.pdf', '-o', 'output'])
+        self.assertEqual((args.format, args.pages, args.recursive, args.workers), ('png', None, False, None))
+    
+    @patch('argparse.ArgumentParser.parse_args')
+    def test_format_option(self, mock_parse_args):
+        """Test that the format option is correctly processed."""
+        # Mock the return value of parse_args for default format
+        mock_args = MagicMock()
+        mock_args.input_path = 'test.pdf'
+        mock_args.output_folder = 'output'
+        mock_args.format = 'png'  # Default value
+        mock_args.pages = None
+        mock_args.recursive = False
+        mock_parse_args.return_value = mock_args
+        
+        # Call the function
+        args = parse_args()
+        
+        # Assert the format argument has the default value
+        self.assertEqual(args.format, 'png')
+        
+        # Mock a different format
+        mock_args.format = 'jpeg'
+        args = parse_args()
+        self.assertEqual(args.format, 'jpeg')
+    
+    @patch('argparse.ArgumentParser.parse_args')
+    def test_pages_option(self, mock_parse_args):
+        """Test that the pages option is correctly processed."""
+        # Mock the return value of parse_args
+        mock_args = MagicMock()
+        mock_args.input_path = 'test.pdf'
+        mock_args.output_folder = 'output'
+        mock_args.format = 'png'
+        mock_args.pages = '1,3-5'
+        mock_args.recursive = False
+        mock_parse_args.return_value = mock_args
+        
+        # Call the function
+        args = parse_args()
+        
+        # Assert the pages argument is passed correctly
+        self.assertEqual(args.pages, '1,3-5')
+    
+    @patch('argparse.ArgumentParser.parse_args')
+    def test_recursive_option(self, mock_parse_args):
+        """Test that the recursive option is correctly processed."""
+        # Mock the return value of parse_args
+        mock_args = MagicMock()
+        mock_args.input_path = 'test.pdf'
+        mock_args.output_folder = 'output'
+        mock_args.format = 'png'
+        mock_args.pages = None
+        mock_args.recursive = True
+        mock_parse_args.return_value = mock_args
+        
+        # Call the function
+        args = parse_args()
+        
+        # Assert the recursive flag is set
+        self.assertTrue(args.recursive)
+
+
+class BlankPixmap:
+    """Lightweight stand-in for a rendered fitz.Pixmap whose samples are all zero."""
+    
+    def __init__(self, width, height, n):
+        self.width = width
+        self.height = height
+        self.n = n
+        self.samples_mv = memoryview(bytes(width * height * n))
+
+
+def render_blank_pixmap(matrix=None, colorspace=None, clip=None, alpha=True):
+    """Mock Page.get_pixmap with a blank pixmap of the requested size."""
+    rect = (clip if clip is not None else fitz.Rect(0, 0, 400, 300)) * matrix
+    return BlankPixmap(int(rect.width), int(rect.height), 1 if colorspace is fitz.csGRAY else 3)
+
+
+class BlankPage:
+    """Lightweight stand-in for a fitz.Page without images that renders as a blank pixmap."""
+    
+    def get_images(self, full=False):
+        return []
+    
+    def get_image_info(self, hashes=False, xrefs=False):
+        return []
+    
+    def get_pixmap(self, matrix=fitz.Identity, colorspace=None, clip=None, alpha=False):
+        return render_blank_pixmap(matrix, colorspace, clip, alpha)
+
+
+def list_output_files(folder):
+    """Return the names of the files in an output folder."""
+    return {entry.name for entry in os.scandir(folder)}
+
+
+def log_messages(logs):
+    """Return the set of messages captured by an assertLogs context."""
+    return {record.getMessage() for record in logs.records}
+
+
+def read_output_files(folder):
+    """Return the contents of the files in an output folder by name."""
+    return {entry.name: pathlib.Path(entry.path).read_bytes() for entry in os.scandir(folder)}
+
+
+def write_output_files(folder, files):
+    """Create files with the given contents by name in an output folder."""
+    for filename, data in files.items():
+        pathlib.Path(folder, filename).write_bytes(data)
+
+
+def make_mock_doc(pages, needs_pass=False):
+    """Mock an open PDF document with the given page mocks."""
+    doc = MagicMock(spec=fitz.Document)
+    doc.needs_pass = needs_pass
+    doc.__len__.return_value = len(pages)
+    doc.__getitem__.side_effect = pages.__getitem__
+    return doc
+
+
+class SynchronousExecutor:
+    """Stand-in for a process pool that runs the work in the calling process."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+
+# Real PDF shared by the tests in this module, generated once by setUpModule
+# in a directory that also holds the files the sample tests write
+SAMPLE_PDF_DIR = None
+SAMPLE_PDF_PATH = None
+
+# (width, height) of the image embedded on each page of the sample PDF
+SAMPLE_PDF_IMAGE_SIZES = [(80, 50), (60, 40)]
+
+
+def setUpModule():
+    """Generate the sample PDF, with one embedded image per page."""
+    global SAMPLE_PDF_DIR, SAMPLE_PDF_PATH
+    SAMPLE_PDF_DIR = tempfile.mkdtemp()
+    SAMPLE_PDF_PATH = os.path.join(SAMPLE_PDF_DIR, 'sample.pdf')
+    
+    doc = fitz.open()
+    for page_idx, (width, height) in enumerate(SAMPLE_PDF_IMAGE_SIZES):
+        # Give every page a different image so each has its own xref
+        image = np.full((height, width, 3), 40 * page_idx, dtype=np.uint8)
+        _, encoded = cv2.imencode('.png', image)
+        page = doc.new_page(width=400, height=300)
+        page.insert_image(fitz.Rect(50, 50, 50 + width, 50 + height), stream=encoded.tobytes())
+    doc.save(SAMPLE_PDF_PATH)
+    doc.close()
+
+
+def tearDownModule():
+    """Remove the sample PDF and the files written next to it."""
+    shutil.rmtree(SAMPLE_PDF_DIR)
+
+
+# get_images rows for the image xrefs used by the mocked pages, built once
+IMAGE_ROWS = {xref: (xref, 0, 0, 0, 0, 0, 0) for xref in range(1, 11)}
+
+# Data extract_image returns for a 100x100 PNG image
+PNG_IMAGE_DATA = {
+    "ext": "png",
+    "width": 100,
+    "height": 100,
+    "image": b"mock image data"
+}
+
+
+class PatchingTestCase(unittest.TestCase):
+    """Test case that can patch objects for the rest of a test."""
+    
+    def start_patch(self, target):
+        """Patch target until the end of the test and return the mock."""
+        patcher = patch(target)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+
+# Page counts of the mocked PDFs iterated through: empty, small, medium and large
+PAGE_ITERATION_COUNTS = [0, 1, 5, 50]
+
+# Page messages expected, in order, for each page count iterated through
+EXPECTED_PAGE_MESSAGES = {
+    page_count: [f'Processing page {page_num} of {page_count}' for page_num in range(1, page_count + 1)]
+    for page_count in PAGE_ITERATION_COUNTS
+}
+
+# (PDF name, {xref: (extension, data)} of the images on its only page,
+#  {filename: data} already in the output folder, expected {filename: data} after extraction)
+STANDARD_EXTRACTION_CASES = [
+    # Single image
+    ("test", {1: ("png", b"mock image data")}, {},
+     {"test-page-1-image-1.png": b"mock image data"}),
+    # Images keep their own extension
+    ("sample", {1: ("png", b"mock png data"), 2: ("jpeg", b"mock jpeg data")}, {},
+     {"sample-page-1-image-1.png": b"mock png data", "sample-page-1-image-2.jpeg": b"mock jpeg data"}),
+    # Existing file is kept and the image gets a suffix
+    ("duplicate", {1: ("png", b"new image data")},
+     {"duplicate-page-1-image-1.png": b"existing image data"},
+     {"duplicate-page-1-image-1.png": b"existing image data",
+      "duplicate-page-1-image-1_1.png": b"new image data"}),
+    # Several numbered collisions push the suffix past the last existing one
+    ("collision", {1: ("png", b"newest image data")},
+     {"collision-page-1-image-1.png": b"existing image data",
+      "collision-page-1-image-1_1.png": b"existing image data 1",
+      "collision-page-1-image-1_2.png": b"existing image data 2"},
+     {"collision-page-1-image-1.png": b"existing image data",
+      "collision-page-1-image-1_1.png": b"existing image data 1",
+      "collision-page-1-image-1_2.png": b"existing image data 2",
+      "collision-page-1-image-1_3.png": b"newest image data"}),
+]
+
+# (pages string, total pages, expected 0-based page indices)
+PARSE_PAGES_CASES = [
+    (None, 5, {0, 1, 2, 3, 4}),  # No pages string selects all pages
+    ('3', 5, {2}),  # Single page
+    ('2-5', 10, {1, 2, 3, 4}),  # Range of pages
+    ('1,3,5', 10, {0, 2, 4}),  # Comma-separated pages
+    ('1,3-5,8', 10, {0, 2, 3, 4, 7}),  # Pages and ranges combined
+    (' 2 , 4 - 5 ', 10, {1, 3, 4}),  # Whitespace around numbers is ignored
+]
+
+# (pages string, total pages, expected 0-based page indices, expected warning)
+PARSE_PAGES_WARNING_CASES = [
+    ('3,8', 5, {2}, "out of range"),  # Only page 3 is in range
+    ('1,a,3', 5, {0, 2}, "Invalid page number"),  # Non-numeric page is skipped
+    ('1-2-3,4', 5, {3}, "Invalid page range"),  # Malformed range is skipped
+]
+
+
+class TestPagesParsing(unittest.TestCase):
+    """Tests for the pages parsing functionality."""
+    
+    def test_parse_pages(self):
+        """Test parsing valid pages strings."""
+        for pages_string, total_pages, expected in PARSE_PAGES_CASES:
+            with self.subTest(pages_string=pages_string):
+                self.assertEqual(parse_pages(pages_string, total_pages), expected)
+    
+    def test_parse_pages_warnings(self):
+        """Test that out-of-range and invalid pages are skipped with a warning."""
+        for pages_string, total_pages, expected, warning in PARSE_PAGES_WARNING_CASES:
+            with self.subTest(pages_string=pages_string):
+                # Capture log output to check warnings
+                with self.assertLogs('card_extractor', level='WARNING') as logs:
+                    pages = parse_pages(pages_string, total_pages)
+                self.assertEqual(pages, expected)
+                self.assertTrue(warning in '\n'.join(logs.output))
+    
+    def test_parse_pages_huge_range(self):
+        """Test that a range over a very large PDF is expanded in full."""
+        pages = parse_pages('1-100000', 200000)
+        self.assertEqual(len(pages), 100000)
+        self.assertEqual((min(pages), max(pages)), (0, 99999))
+        
+        # Check that a range past the end is clipped to the last page
+        self.assertEqual(len(parse_pages('99990-100010', 100000)), 11)
+
+
+class TestPDFProcessing(PatchingTestCase):
+    """Tests for the PDF processing functionality."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create an output folder shared by the tests of this class."""
+        # Tests that save pages write to their own subfolder, the others write nothing
+        cls.output_folder = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.output_folder)
+    
+    def setUp(self):
+        """Patch PDF opening and password prompts."""
+        self.mock_looks_like_pdf = self.start_patch('src.card_extractor.main._looks_like_pdf')
+        self.mock_looks_like_pdf.return_value = True
+        self.mock_open = self.start_patch('fitz.open')
+        self.mock_input = self.start_patch('builtins.input')
+    
+    def test_process_pdf_file_not_found(self):
+        """Test handling of non-existent PDF files."""
+        # Mock a missing file when opening the PDF
+        self.mock_open.side_effect = FileNotFoundError("File not found")
+        
+        # Call the function with a non-existent file
+        with self.assertLogs('card_extractor', level='ERROR') as logs:
+            needs_password = process_pdf('nonexistent.pdf', self.output_folder)
+        
+        # Assert the correct error message was logged
+        self.assertEqual(logs.records[-1].getMessage(), 'Error: PDF file not found: nonexistent.pdf')
+        self.assertIs(needs_password, False)
+    
+    def test_process_pdf_page_iteration(self):
+        """Test iteration through empty, small, medium and large PDFs."""
+        for page_count in PAGE_ITERATION_COUNTS:
+            with self.subTest(page_count=page_count):
+                # Mock a PDF document with the pages all sharing one blank page
+                mock_doc = make_mock_doc([BlankPage()] * page_count)
+                self.mock_open.return_value = mock_doc
+                
+                # Capture log output, writing to a folder that does not exist yet
+                output_folder = os.path.join(self.output_folder, f'pages-{page_count}')
+                with self.assertLogs('card_extractor', level='INFO') as logs:
+                    process_pdf(f'pages-{page_count}.pdf', output_folder)
+                
+                # Assert that we processed every page exactly once, in order
+                page_messages = [record.getMessage() for record in logs.records
+                                 if record.getMessage().startswith('Processing page')]
+                self.assertEqual(page_messages, EXPECTED_PAGE_MESSAGES[page_count])
+                
+                # Check that the output folder was created with each blank page saved whole
+                self.assertEqual(list_output_files(output_folder),
+                                 {f'pages-{page_count}-page-{page_num}-image-1.png'
+                                  for page_num in range(1, page_count + 1)})
+    
+    @patch('src.card_extractor.main._create_worker_pool')
+    def test_process_pdf_parallel(self, mock_create_pool):
+        """Test that the pages of a larger PDF are spread over worker processes."""
+        # Mock a PDF document with 5 pages and run the workers synchronously
+        mock_doc = make_mock_doc([BlankPage()] * 5)
+        self.mock_open.return_value = mock_doc
+        mock_create_pool.return_value = SynchronousExecutor()
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf('large.pdf', os.path.join(self.output_folder, 'large'), workers=2)
+        
+        # Check that two workers each reopened the PDF
+        mock_create_pool.assert_called_once_with(2)
+        self.assertEqual(self.mock_open.call_count, 3)
+        
+        # Check that every page was processed exactly once
+        page_messages = [record.getMessage() for record in logs.records
+                         if record.getMessage().startswith('Processing page')]
+        self.assertCountEqual(page_messages, EXPECTED_PAGE_MESSAGES[5])
+    
+    @patch('src.card_extractor.main._create_worker_pool')
+    def test_process_pdf_parallel_small(self, mock_create_pool):
+        """Test that small PDFs are processed without starting worker processes."""
+        # Mock a PDF document with 3 pages
+        mock_doc = make_mock_doc([BlankPage()] * 3)
+        self.mock_open.return_value = mock_doc
+        
+        with self.assertLogs('card_extractor', level='INFO'):
+            process_pdf('small.pdf', os.path.join(self.output_folder, 'small'), workers=4)
+        
+        # Check that the pages were processed in this process
+        mock_create_pool.assert_not_called()
+        self.mock_open.assert_called_once_with('small.pdf')
+    
+    def test_process_pdf_password_protected(self):
+        """Test handling of password-protected PDFs."""
+        # Mock an encrypted PDF that the right password unlocks
+        mock_doc = make_mock_doc([], needs_pass=True)
+        mock_doc.authenticate.return_value = 2
+        self.mock_open.return_value = mock_doc
+        
+        # Mock the password input
+        self.mock_input.return_value = 'correct_password'
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf('protected.pdf', self.output_folder)
+        
+        # Check that the user was prompted for the password
+        self.assertTrue('password-protected' in self.mock_input.call_args[0][0])
+        
+        # Check that the open document was unlocked instead of reopened
+        self.mock_open.assert_called_once_with('protected.pdf')
+        mock_doc.authenticate.assert_called_once_with('correct_password')
+        self.assertTrue('Processing: protected.pdf' in '\n'.join(logs.output))
+    
+    def test_process_pdf_password_incorrect(self):
+        """Test handling of incorrect password for protected PDFs."""
+        # Mock an encrypted PDF that rejects the password
+        mock_doc = make_mock_doc([], needs_pass=True)
+        mock_doc.authenticate.return_value = 0
+        self.mock_open.return_value = mock_doc
+        
+        # Mock the password input
+        self.mock_input.return_value = 'wrong_password'
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf('protected.pdf', self.output_folder)
+        
+        # Check that error was handled
+        self.assertTrue('Incorrect password' in '\n'.join(logs.output))
+        mock_doc.close.assert_called_once()
+    
+    def test_process_pdf_password_empty(self):
+        """Test handling of empty password for protected PDFs."""
+        # Mock an encrypted PDF
+        mock_doc = make_mock_doc([], needs_pass=True)
+        self.mock_open.return_value = mock_doc
+        
+        # Mock the password input to return empty string
+        self.mock_input.return_value = ''
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            needs_password = process_pdf('protected.pdf', self.output_folder)
+        
+        # Check that file was skipped without being handed back for a password
+        self.assertTrue('No password provided' in '\n'.join(logs.output))
+        self.assertIs(needs_password, False)
+        mock_doc.authenticate.assert_not_called()
+    
+    def test_process_pdf_password_not_interactive(self):
+        """Test that protected PDFs are handed back when prompting is disabled."""
+        # Mock an encrypted PDF
+        mock_doc = make_mock_doc([], needs_pass=True)
+        self.mock_open.return_value = mock_doc
+        
+        needs_password = process_pdf('protected.pdf', self.output_folder, interactive=False)
+        
+        # Check that the PDF was skipped without prompting
+        self.assertTrue(needs_password)
+        self.mock_input.assert_not_called()
+        mock_doc.close.assert_called_once()
+    
+    def test_process_pdf_corrupted(self):
+        """Test handling of corrupted PDF files."""
+        # Mock a FileDataError when opening the PDF
+        self.mock_open.side_effect = fitz.FileDataError("Invalid PDF data")
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf('corrupted.pdf', self.output_folder)
+        
+        # Check that error was handled
+        self.assertTrue('corrupted or not a valid PDF file' in '\n'.join(logs.output))
+    
+    def test_process_pdf_bad_header(self):
+        """Test that files without a PDF header are skipped without parsing them."""
+        # Check the header of a real file that is not a PDF
+        self.mock_looks_like_pdf.side_effect = _looks_like_pdf
+        pdf_path = os.path.join(self.output_folder, 'notes.pdf')
+        pathlib.Path(pdf_path).write_bytes(b'Meeting notes, not a PDF\n' * 100)
+        self.addCleanup(os.remove, pdf_path)
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='ERROR') as logs:
+            process_pdf(pdf_path, self.output_folder)
+        
+        # Check that error was logged and MuPDF never opened the file
+        self.assertTrue('corrupted or not a valid PDF file' in '\n'.join(logs.output))
+        self.mock_open.assert_not_called()
+    
+    def test_process_pdf_header_after_junk(self):
+        """Test that a PDF header preceded by a few junk bytes is still opened."""
+        self.mock_looks_like_pdf.side_effect = _looks_like_pdf
+        self.mock_open.return_value = make_mock_doc([])
+        pdf_path = os.path.join(self.output_folder, 'junk.pdf')
+        pathlib.Path(pdf_path).write_bytes(b'\r\n\xef\xbb\xbf%PDF-1.7\n')
+        self.addCleanup(os.remove, pdf_path)
+        
+        with self.assertLogs('card_extractor', level='INFO'):
+            process_pdf(pdf_path, self.output_folder)
+        
+        # Check that the header was found and the file handed to MuPDF
+        self.mock_open.assert_called_once_with(pdf_path)
+
+
+class TestImageDetection(unittest.TestCase):
+    """Tests for the computer vision image detection functionality."""
+    
+    def test_detect_and_extract_image_regions(self):
+        """Test the image region detection function."""
+        # Mock a white page with two distinct colored regions
+        mock_image = np.full((500, 400, 3), 255, dtype=np.uint8)
+        cv2.rectangle(mock_image, (50, 50), (150, 150), (0, 0, 255), -1)
+        cv2.rectangle(mock_image, (200, 200), (300, 280), (0, 255, 0), -1)
+        
+        # Call the function
+        regions = detect_and_extract_image_regions(mock_image)
+        
+        # Check that it returned the expected number of regions
+        self.assertEqual(len(regions), 2)
+        
+        # Check that regions are ordered largest first
+        self.assertGreater(regions[0].shape[0] * regions[0].shape[1],
+                           regions[1].shape[0] * regions[1].shape[1])
+    
+    def test_detect_and_extract_image_regions_from_path(self):
+        """Test that regions are also detected in an image read from a file."""
+        # Mock a white page with one colored region saved to disk
+        mock_image = np.full((500, 400, 3), 255, dtype=np.uint8)
+        cv2.rectangle(mock_image, (50, 50), (150, 150), (0, 0, 255), -1)
+        image_path = os.path.join(SAMPLE_PDF_DIR, "page.png")
+        cv2.imwrite(image_path, mock_image)
+        
+        # Call the function with the path instead of the array
+        regions = detect_and_extract_image_regions(image_path)
+        
+        # Check that the same region was found as in the array itself
+        self.assertEqual(len(regions), 1)
+        self.assertEqual([region.shape for region in regions],
+                         [region.shape for region in detect_and_extract_image_regions(mock_image)])
+    
+    def test_detect_and_extract_image_regions_unreadable_path(self):
+        """Test that a path that cannot be read as an image raises a ValueError."""
+        # A missing file and a file that is not an image
+        missing_path = os.path.join(SAMPLE_PDF_DIR, "missing.png")
+        invalid_path = os.path.join(SAMPLE_PDF_DIR, "invalid.png")
+        pathlib.Path(invalid_path).write_bytes(b"not an image")
+        
+        for image_path in (missing_path, invalid_path):
+            with self.subTest(image_path=image_path):
+                with self.assertRaisesRegex(ValueError, "Could not read image"):
+                    detect_and_extract_image_regions(image_path)
+    
+    def test_detect_image_regions(self):
+        """Test that region boxes are found on a grayscale page."""
+        # Mock a white grayscale page with one dark region
+        mock_image = np.full((500, 400), 255, dtype=np.uint8)
+        cv2.rectangle(mock_image, (100, 120), (300, 320), 0, -1)
+        
+        # Call the function at full resolution, where no downsampled copy is made
+        boxes = detect_image_regions(mock_image, detection_scale=1.0)
+        
+        # Check that one box around the region was returned, with a margin
+        self.assertEqual(boxes.shape, (1, 4))
+        x1, y1, x2, y2 = boxes[0]
+        self.assertTrue(80 <= x1 <= 100 and 100 <= y1 <= 120)
+        self.assertTrue(300 <= x2 <= 320 and 320 <= y2 <= 340)
+        
+        # Check that the caller's image was not modified by the in-place blur
+        self.assertEqual(np.unique(mock_image).tolist(), [0, 255])
+    
+    def test_detect_and_extract_image_regions_nested(self):
+        """Test that regions nested inside a larger region are not extracted."""
+        # Mock a card with artwork inside its frame
+        mock_image = np.full((500, 400, 3), 255, dtype=np.uint8)
+        cv2.rectangle(mock_image, (50, 50), (300, 400), (0, 0, 0), 3)
+        cv2.rectangle(mock_image, (100, 100), (250, 250), (255, 0, 0), -1)
+        
+        # Call the function
+        regions = detect_and_extract_image_regions(mock_image)
+        
+        # Check that only the outer card was extracted
+        self.assertEqual(len(regions), 1)
+        self.assertGreater(regions[0].shape[0], 350)
+    
+    def test_detect_and_extract_image_regions_no_significant_contours(self):
+        """Test detection function when no significant contours are found."""
+        # Mock a page with only small specks (below min_area=1000)
+        mock_image = np.full((500, 400, 3), 255, dtype=np.uint8)
+        cv2.rectangle(mock_image, (50, 50), (55, 55), (0, 0, 0), -1)
+        cv2.rectangle(mock_image, (200, 300), (204, 306), (0, 0, 0), -1)
+        
+        # Call the function
+        regions = detect_and_extract_image_regions(mock_image)
+        
+        # Check that no regions were returned (all contours too small)
+        self.assertEqual(regions, [])
+
+
+class TestImageExtraction(PatchingTestCase):
+    """Tests for the image extraction and saving functionality."""
+    
+    def setUp(self):
+        """Patch PDF opening, treating the mocked paths as PDFs, and create an output folder."""
+        self.start_patch('src.card_extractor.main._looks_like_pdf').return_value = True
+        self.mock_open = self.start_patch('fitz.open')
+        
+        # Write to a real folder that is removed after the test
+        self.output_folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_folder)
+    
+    def test_image_extraction_standard_method(self):
+        """Test image extraction using the standard PyMuPDF method."""
+        for pdf_name, images, existing_files, expected_files in STANDARD_EXTRACTION_CASES:
+            with self.subTest(pdf_name=pdf_name):
+                # Mock PDF document and page with one image per xref
+                mock_page = Mock(spec=fitz.Page)
+                mock_doc = make_mock_doc([mock_page])
+                self.mock_open.return_value = mock_doc
+                mock_page.get_images.return_value = [IMAGE_ROWS[xref] for xref in images]
+                
+                # Mock extract_image return values
+                mock_doc.extract_image.side_effect = {
+                    xref: dict(PNG_IMAGE_DATA, ext=ext, image=data) for xref, (ext, data) in images.items()
+                }.__getitem__
+                
+                # Create the files already in the output folder
+                output_folder = os.path.join(self.output_folder, pdf_name)
+                os.makedirs(output_folder)
+                write_output_files(output_folder, existing_files)
+                
+                # Capture log output
+                with self.assertLogs('card_extractor', level='INFO'):
+                    process_pdf(f"{pdf_name}.pdf", output_folder)
+                
+                # Check that every image was extracted by its xref
+                self.assertEqual(mock_doc.extract_image.call_args_list, [call(xref) for xref in images])
+                
+                # Check that each image was written without overwriting existing files
+                self.assertEqual(read_output_files(output_folder), expected_files)
+    
+    def test_image_extraction_duplicate_xref(self):
+        """Test that an image referenced twice on a page is extracted once."""
+        # Mock PDF document and page
+        mock_page = Mock(spec=fitz.Page)
+        mock_doc = make_mock_doc([mock_page])
+        self.mock_open.return_value = mock_doc
+        
+        # The same image (xref 1) placed under two different names
+        mock_page.get_images.return_value = [
+            (1, 0, 100, 100, 8, "DeviceRGB", "", "Im1", "DCTDecode", 0),
+            (1, 0, 100, 100, 8, "DeviceRGB", "", "Im2", "DCTDecode", 0),
+        ]
+        mock_doc.extract_image.return_value = PNG_IMAGE_DATA
+        
+        with self.assertLogs('card_extractor', level='INFO'):
+            process_pdf("test.pdf", self.output_folder)
+        
+        # Check that the image was only extracted and written once
+        mock_doc.extract_image.assert_called_once_with(1)
+        self.assertEqual(list_output_files(self.output_folder), {"test-page-1-image-1.png"})
+    
+    @patch('src.card_extractor.main.detect_image_regions')
+    @patch('src.card_extractor.main.save_image')
+    def test_image_extraction_opencv_method(self, mock_save, mock_detect):
+        """Test image extraction using the OpenCV fallback method."""
+        # Mock PDF document and page with no embedded images
+        mock_page = Mock(spec=fitz.Page)
+        mock_doc = make_mock_doc([mock_page])
+        self.mock_open.return_value = mock_doc
+        
+        # Page has no images via standard method or image placements
+        mock_page.get_images.return_value = []
+        mock_page.get_image_info.return_value = []
+        
+        # Mock rendering of a 400x300 page at 2x zoom
+        mock_page.get_pixmap.side_effect = render_blank_pixmap
+        
+        # Mock OpenCV detection to find two regions
+        mock_detect.return_value = np.array([[0, 0, 300, 200], [400, 300, 650, 450]])
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf("test.pdf", self.output_folder, "png")
+        
+        # Check that detection ran on a grayscale render of the page
+        mock_detect.assert_called_once()
+        page_image = mock_detect.call_args[0][0]
+        self.assertEqual(page_image.shape, (600, 800))
+        
+        # Check that only the detected regions were rendered in color
+        clips = [kwargs["clip"] for _, kwargs in mock_page.get_pixmap.call_args_list[1:]]
+        self.assertEqual(clips, [fitz.Rect(0, 0, 150, 100), fitz.Rect(200, 150, 325, 225)])
+        
+        # Check that save_image was called for each region
+        self.assertEqual(mock_save.call_count, 2)
+        saved_shapes = [saved_call[0][0].shape for saved_call in mock_save.call_args_list]
+        self.assertEqual(saved_shapes, [(200, 300, 3), (150, 250, 3)])
+        
+        # Check output log
+        output_text = '\n'.join(logs.output)
+        self.assertTrue('No images extracted using standard method' in output_text)
+        self.assertTrue('Using computer vision to detect images' in output_text)
+        self.assertTrue('Detected 2 distinct image regions' in output_text)
+    
+    @patch('src.card_extractor.main._write_fd')
+    def test_image_extraction_write_failure(self, mock_write):
+        """Test that a failed image write removes its file and falls back to rendering the page."""
+        # Mock PDF document and blank page with one extractable image
+        mock_page = Mock(spec=fitz.Page)
+        mock_doc = make_mock_doc([mock_page])
+        self.mock_open.return_value = mock_doc
+        mock_page.get_images.return_value = [IMAGE_ROWS[1]]
+        mock_page.get_image_info.return_value = []
+        mock_page.get_pixmap.side_effect = render_blank_pixmap
+        mock_doc.extract_image.return_value = PNG_IMAGE_DATA
+        
+        # Mock the image write failing after the file was claimed, closing
+        # the file like the real write does
+        def fail_write(fd, data):
+            os.close(fd)
+            raise OSError("No space left on device")
+        
+        mock_write.side_effect = fail_write
+        
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf("test.pdf", self.output_folder, "png")
+        
+        # Check that the error was logged and the page was saved in place of
+        # the image, under the name the failed write had claimed
+        self.assertIn("  Error writing image 1 (xref=1): No space left on device", log_messages(logs))
+        self.assertIn("  No images extracted using standard method from page 1", log_messages(logs))
+        self.assertEqual(list_output_files(self.output_folder), {"test-page-1-image-1.png"})
+        saved = cv2.imread(os.path.join(self.output_folder, "test-page-1-image-1.png"))
+        self.assertEqual(saved.shape, (600, 800, 3))
+    
+    @patch('src.card_extractor.main.detect_image_regions')
+    def test_image_extraction_opencv_no_regions(self, mock_detect):
+        """Test OpenCV fallback when no image regions are detected."""
+        # Mock PDF document and page with no embedded images
+        mock_page = Mock(spec=fitz.Page)
+        mock_doc = make_mock_doc([mock_page])
+        self.mock_open.return_value = mock_doc
+        
+        # Page has no images via standard method or image placements
+        mock_page.get_images.return_value = []
+        mock_page.get_image_info.return_value = []
+        
+        # Mock rendering of a 400x300 page at 2x zoom
+        mock_page.get_pixmap.side_effect = render_blank_pixmap
+        
+        # Mock OpenCV detection to find no regions
+        mock_detect.return_value = np.empty((0, 4), dtype=np.int64)
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf("test.pdf", self.output_folder, "png")
+        
+        # Check that the whole page was rendered in color and saved
+        self.assertEqual(mock_page.get_pixmap.call_count, 2)
+        self.assertEqual(list_output_files(self.output_folder), {"test-page-1-image-1.png"})
+        saved = cv2.imread(os.path.join(self.output_folder, "test-page-1-image-1.png"))
+        self.assertEqual(saved.shape, (600, 800, 3))
+        
+        # Check output log
+        output_text = '\n'.join(logs.output)
+        self.assertTrue('No distinct image regions detected' in output_text)
+        self.assertTrue('Saved full page as:' in output_text)
+    
+    @patch('src.card_extractor.main.detect_image_regions')
+    def test_image_extraction_from_image_placements(self, mock_detect):
+        """Test that image placements reported by PyMuPDF are cropped directly."""
+        # Mock PDF document and page with no extractable images
+        mock_page = Mock(spec=fitz.Page)
+        mock_doc = make_mock_doc([mock_page])
+        self.mock_open.return_value = mock_doc
+        mock_page.get_images.return_value = []
+        
+        # Unrotated page reports one image placement in page coordinates
+        mock_page.get_image_info.return_value = [{"bbox": (10, 20, 60, 45)}]
+        mock_page.rotation_matrix = fitz.Identity
+        
+        # Mock a 2x rendered 200x100 RGB page
+        mock_pixmap = Mock(spec=fitz.Pixmap)
+        mock_pixmap.width = 200
+        mock_pixmap.height = 100
+        mock_pixmap.n = 3
+        mock_pixmap.samples_mv = memoryview(bytes(200 * 100 * 3))
+        mock_page.get_pixmap.return_value = mock_pixmap
+        
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf("test.pdf", self.output_folder, "png")
+        
+        # Check that computer vision was skipped
+        mock_detect.assert_not_called()
+        self.assertTrue('Cropping 1 image placements' in '\n'.join(logs.output))
+        
+        # Check that the placement was cropped at render resolution
+        self.assertEqual(list_output_files(self.output_folder), {"test-page-1-image-1.png"})
+        saved = cv2.imread(os.path.join(self.output_folder, "test-page-1-image-1.png"))
+        self.assertEqual(saved.shape, (50, 100, 3))
+    
+    def test_multiple_images_per_page(self):
+        """Test extraction of multiple images from a single page."""
+        # Mock PDF document and page
+        mock_page = Mock(spec=fitz.Page)
+        mock_doc = make_mock_doc([mock_page])
+        self.mock_open.return_value = mock_doc
+        
+        # Mock many images on a page (10 images)
+        mock_page.get_images.return_value = list(IMAGE_ROWS.values())
+        
+        # Mock extract_image return values
+        mock_doc.extract_image.side_effect = {
+            xref: dict(PNG_IMAGE_DATA, image=f"image data {xref}".encode()) for xref in range(1, 11)
+        }.__getitem__
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO'):
+            process_pdf("multi_image.pdf", self.output_folder)
+        
+        # Check that all 10 images were written following the naming pattern
+        self.assertEqual(read_output_files(self.output_folder),
+                         {f"multi_image-page-1-image-{i}.png": f"image data {i}".encode()
+                          for i in range(1, 11)})
+    
+    def test_various_image_sizes(self):
+        """Test extraction of images with different dimensions."""
+        # Mock PDF document and page
+        mock_page = Mock(spec=fitz.Page)
+        mock_doc = make_mock_doc([mock_page])
+        self.mock_open.return_value = mock_doc
+        
+        # Mock images of different sizes
+        mock_page.get_images.return_value = [IMAGE_ROWS[xref] for xref in range(1, 4)]
+        
+        # Mock extract_image return values with different dimensions
+        sizes = {
+            1: (50, 50),      # Small image
+            2: (500, 500),    # Medium image
+            3: (2000, 1500)   # Large image
+        }
+        mock_doc.extract_image.side_effect = {
+            xref: dict(PNG_IMAGE_DATA, width=width, height=height,
+                       image=f"image data size {width}x{height}".encode())
+            for xref, (width, height) in sizes.items()
+        }.__getitem__
+        
+        # Capture log output to verify dimensions are logged
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf("size_test.pdf", self.output_folder)
+        
+        # Check all image files were created with their own data
+        self.assertEqual(read_output_files(self.output_folder), {
+            f"size_test-page-1-image-{i}.png": f"image data size {width}x{height}".encode()
+            for i, (width, height) in enumerate(sizes.values(), start=1)
+        })
+        
+        # Verify dimensions were logged correctly
+        expected_messages = {
+            f"  Extracted image: size_test-page-1-image-{i}.png, Dimensions: {width}x{height}"
+            for i, (width, height) in enumerate(sizes.values(), start=1)
+        }
+        self.assertLessEqual(expected_messages, log_messages(logs))
+    
+    def test_multi_page_multi_image(self):
+        """Test extraction from multiple pages with multiple images each."""
+        # Mock PDF document with 3 pages
+        mock_pages = [Mock(spec=fitz.Page) for _ in range(3)]
+        mock_doc = make_mock_doc(mock_pages)
+        self.mock_open.return_value = mock_doc
+        
+        # Mock different numbers of images per page
+        # Page 1: 2 images, Page 2: 3 images, Page 3: 1 image
+        mock_pages[0].get_images.return_value = [IMAGE_ROWS[1], IMAGE_ROWS[2]]
+        mock_pages[1].get_images.return_value = [IMAGE_ROWS[3], IMAGE_ROWS[4], IMAGE_ROWS[5]]
+        mock_pages[2].get_images.return_value = [IMAGE_ROWS[6]]
+        
+        # Mock extract_image return values, with a different size for each image
+        mock_doc.extract_image.side_effect = {
+            xref: dict(PNG_IMAGE_DATA, width=100 * xref, height=75 * xref,
+                       image=f"image data xref {xref}".encode())
+            for xref in range(1, 7)
+        }.__getitem__
+        
+        # Capture log output
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf("multi_page.pdf", self.output_folder)
+        
+        # Expected filenames based on page number and image number, with the data of each xref
+        expected_files = {
+            "multi_page-page-1-image-1.png": b"image data xref 1",  # Page 1
+            "multi_page-page-1-image-2.png": b"image data xref 2",
+            "multi_page-page-2-image-1.png": b"image data xref 3",  # Page 2
+            "multi_page-page-2-image-2.png": b"image data xref 4",
+            "multi_page-page-2-image-3.png": b"image data xref 5",
+            "multi_page-page-3-image-1.png": b"image data xref 6",  # Page 3
+        }
+        self.assertEqual(read_output_files(self.output_folder), expected_files)
+        
+        # Check for processing messages for each page
+        messages = log_messages(logs)
+        self.assertLessEqual({f"Processing page {i} of 3" for i in range(1, 4)}, messages)
+        
+        # Check for specific dimension logs
+        dimensions = {message.rpartition("Dimensions: ")[2] for message in messages
+                      if message.startswith("  Extracted image: ")}
+        self.assertEqual(dimensions, {f"{100*i}x{75*i}" for i in range(1, 7)})
+    
+    def test_no_images_in_pdf(self):
+        """Test that pages without images are saved as a whole."""
+        # Mock PDF document with pages but no images
+        mock_doc = make_mock_doc([BlankPage()] * 2)
+        self.mock_open.return_value = mock_doc
+        
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf("no_images.pdf", self.output_folder)
+        
+        # Verify each page was saved as a single image
+        self.assertEqual(list_output_files(self.output_folder),
+                         {"no_images-page-1-image-1.png", "no_images-page-2-image-1.png"})
+        
+        # Verify pages were still processed
+        messages = log_messages(logs)
+        self.assertLessEqual({"Processing page 1 of 2", "Processing page 2 of 2"}, messages)
+        # No "Extracted image" messages should appear
+        self.assertFalse(any(message.startswith("  Extracted image") for message in messages))
+    
+    def test_save_image(self):
+        """Test the save_image function."""
+        # A BGR image with a distinct color in each corner
+        image = np.zeros((20, 30, 3), dtype=np.uint8)
+        image[:10, :15] = (255, 0, 0)
+        image[10:, 15:] = (0, 0, 255)
+        
+        for format in ("png", "bmp", "PNG"):
+            with self.subTest(format=format):
+                output_path = os.path.join(self.output_folder, f"output-{format}.{format}")
+                save_image(image, output_path, format)
+                
+                # Check that the image round-trips without a channel swap
+                np.testing.assert_array_equal(cv2.imread(output_path), image)
+        
+        # Check that an open file can be written to as well
+        output_path = os.path.join(self.output_folder, "output.jpg")
+        with open(output_path, "wb") as output_file:
+            save_image(image, output_file, "jpeg")
+        saved = cv2.imread(output_path)
+        self.assertEqual(saved.shape, image.shape)
+        self.assertGreater(saved[0, 0, 0], 200)
+        self.assertLess(saved[0, 0, 2], 50)
+    
+    def test_save_image_unsupported_format(self):
+        """Test that save_image rejects formats it cannot encode."""
+        image = np.zeros((20, 30, 3), dtype=np.uint8)
+        with self.assertRaises(ValueError):
+            save_image(image, io.BytesIO(), "gif")
+
+
+class TestSamplePDF(unittest.TestCase):
+    """Tests extracting images from the real sample PDF."""
+    
+    def test_process_pdf(self):
+        """Test that the embedded image of every page is extracted."""
+        output_folder = os.path.join(SAMPLE_PDF_DIR, 'all_pages')
+        with self.assertLogs('card_extractor', level='INFO'):
+            process_pdf(SAMPLE_PDF_PATH, output_folder)
+        
+        # Check that each page's image was saved with its original size
+        self.assertEqual(list_output_files(output_folder),
+                         {'sample-page-1-image-1.png', 'sample-page-2-image-1.png'})
+        for page_num, (width, height) in enumerate(SAMPLE_PDF_IMAGE_SIZES, start=1):
+            image = cv2.imread(os.path.join(output_folder, f'sample-page-{page_num}-image-1.png'))
+            self.assertEqual(image.shape, (height, width, 3))
+    
+    def test_process_pdf_pages(self):
+        """Test that only the selected pages are extracted."""
+        output_folder = os.path.join(SAMPLE_PDF_DIR, 'selected_pages')
+        with self.assertLogs('card_extractor', level='INFO'):
+            process_pdf(SAMPLE_PDF_PATH, output_folder, pages_string='2')
+        
+        self.assertEqual(list_output_files(output_folder), {'sample-page-2-image-1.png'})
+    
+    def test_process_pdf_rotated_inline_image(self):
+        """Test that an inline image on a rotated page is cropped where it is rendered."""
+        # Build a page rotated by 90 degrees holding a red 300x400 inline image,
+        # which has no xref so only its placement can be cropped
+        pdf_path = os.path.join(SAMPLE_PDF_DIR, 'rotated.pdf')
+        doc = fitz.open()
+        page = doc.new_page(width=600, height=800)
+        contents_xref = doc.get_new_xref()
+        doc.update_object(contents_xref, '<<>>')
+        doc.update_stream(contents_xref, b'q 300 0 0 400 100 200 cm BI /W 2 /H 2 /CS /RGB /BPC 8 ID '
+                                         + bytes([255, 0, 0]) * 4 + b' EI Q')
+        doc.xref_set_key(page.xref, 'Contents', f'{contents_xref} 0 R')
+        page.set_rotation(90)
+        doc.save(pdf_path)
+        doc.close()
+        
+        output_folder = os.path.join(SAMPLE_PDF_DIR, 'rotated_page')
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_pdf(pdf_path, output_folder)
+        self.assertIn('  Cropping 1 image placements found on page 1', log_messages(logs))
+        
+        # Check that the crop is the image turned with the page, rendered at 2x
+        # zoom, and holds only the red image rather than the blank page
+        self.assertEqual(list_output_files(output_folder), {'rotated-page-1-image-1.png'})
+        image = cv2.imread(os.path.join(output_folder, 'rotated-page-1-image-1.png'))
+        self.assertEqual(image.shape, (600, 800, 3))
+        self.assertTrue((image == (0, 0, 255)).all())
+
+
+class TestDirectoryProcessing(PatchingTestCase):
+    """Tests for processing a directory of PDFs over worker processes."""
+    
+    def setUp(self):
+        """Create an input folder and run the worker pool synchronously."""
+        self.input_folder = tempfile.mkdtemp(dir=SAMPLE_PDF_DIR)
+        self.output_folder = os.path.join(self.input_folder, 'output')
+        self.mock_create_pool = self.start_patch('src.card_extractor.main._create_worker_pool')
+        self.mock_create_pool.return_value = SynchronousExecutor()
+        self.mock_input = self.start_patch('builtins.input')
+    
+    def write_pdfs(self, names):
+        """Copy the sample PDF into the input folder under each name."""
+        for name in names:
+            shutil.copyfile(SAMPLE_PDF_PATH, os.path.join(self.input_folder, name))
+    
+    def expected_output_files(self, names):
+        """Return the images extracted from the sample PDF copied under each name."""
+        return {f'{os.path.splitext(name)[0]}-page-{page_num}-image-1.png'
+                for name in names for page_num in range(1, len(SAMPLE_PDF_IMAGE_SIZES) + 1)}
+    
+    def test_process_directory_parallel(self):
+        """Test that several PDFs are spread over workers sharing a new output folder."""
+        names = ['first.pdf', 'second.pdf', 'third.pdf']
+        self.write_pdfs(names)
+        pathlib.Path(self.input_folder, 'notes.txt').write_text('not a PDF')
+        
+        with self.assertLogs('card_extractor', level='INFO') as logs:
+            process_directory(self.input_folder, self.output_folder, workers=2)
+        
+        # Check that the output folder was created and every PDF extracted into it
+        self.mock_create_pool.assert_called_once_with(2)
+        self.assertEqual(list_output_files(self.output_folder), self.expected_output_files(names))
+        self.assertEqual([record for record in logs.records if record.levelname == 'ERROR'], [])
+        self.mock_input.assert_not_called()
+    
+    def test_process_directory_serial(self):
+        """Test that a single PDF, or a single worker, does not start a worker pool."""
+        self.write_pdfs(['only.pdf'])
+        
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+                with self.assertLogs('card_extractor', level='INFO'):
+                    process_directory(self.input_folder, os.path.join(self.output_folder, str(workers)),
+                                      workers=workers)
+                self.assertEqual(list_output_files(os.path.join(self.output_folder, str(workers))),
+                                 self.expected_output_files(['only.pdf']))
+        
+        self.mock_create_pool.assert_not_called()
+    
+    def test_process_directory_password_protected(self):
+        """Test that protected PDFs are handed back and prompted for once the pool is done."""
+        self.write_pdfs(['plain.pdf'])
+        doc = fitz.open(SAMPLE_PDF_PATH)
+        doc.save(os.path.join(self.input_folder, 'protected.pdf'), encryption=fitz.PDF_ENCRYPT_AES_256,
+                 owner_pw='owner', user_pw='secret')
+        doc.close()
+        
+        # Record when the pool finishes and when the password is prompted for
+        events = []
+        
+        class RecordingExecutor(SynchronousExecutor):
+            def __exit__(self, *exc_info):
+                events.append('pool finished')
+                return False
+        
+        self.mock_create_pool.return_value = RecordingExecutor()
+        self.mock_input.side_effect = lambda prompt: events.append('prompt') or 'secret'
+        
+        with self.assertLogs('card_extractor', level='INFO'):
+            process_directory(self.input_folder, self.output_folder, workers=2)
+        
+        # Check that the workers skipped the protected PDF and it was only
+        # prompted for once, after the pool finished
+        self.assertEqual(events, ['pool finished', 'prompt'])
+        self.assertIn('protected.pdf', self.mock_input.call_args.args[0])
+        self.assertEqual(list_output_files(self.output_folder),
+                         self.expected_output_files(['plain.pdf', 'protected.pdf']))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file